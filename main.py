@@ -159,7 +159,7 @@ async def main():
     
     # Register all tools using FastMCP decorators
     @mcp.tool()
-    async def get_issue(issue_key: str, expand: str = "changelog,renderedFields") -> dict:
+    async def get_issue(issue_key: str, expand: str = "") -> dict:
         """Get detailed information about a Jira issue."""
         arguments = {"issue_key": issue_key, "expand": expand}
         result = await handle_get_issue(jira_service, arguments)
@@ -217,18 +217,20 @@ async def main():
     
     @mcp.tool()
     async def update_issue(
-        issue_key: str,
+        issue_key: str = "",
         summary: str = "",
         description: str = "",
         priority: str = "",
         assignee: str = "",
         labels: list[str] = None,
         components: list[str] = None,
-        custom_fields: dict = None
+        custom_fields: dict = None,
+        issue_keys: list[str] = None
     ) -> dict:
-        """Update an existing Jira issue."""
+        """Update one or more existing Jira issues (issue_key and/or issue_keys)."""
         arguments = {
             "issue_key": issue_key,
+            "issue_keys": issue_keys or [],
             "summary": summary,
             "description": description,
             "priority": priority,
@@ -251,6 +253,13 @@ async def main():
         result = await handle_transition_issue(jira_service, arguments)
         return convert_result(result)
     
+    @mcp.tool()
+    async def batch_transition_issues(items: list[dict]) -> dict:
+        """Transition several Jira issues at once. Each item needs issue_key and transition_name."""
+        arguments = {"items": items}
+        result = await handle_batch_transition_issues(jira_service, arguments)
+        return convert_result(result)
+    
     @mcp.tool()
     async def add_comment(issue_key: str, comment: str) -> dict:
         """Add a comment to a Jira issue."""
@@ -314,9 +323,9 @@ async def main():
         return convert_result(result)
     
     @mcp.tool()
-    async def get_boards(project_key: str = "") -> dict:
-        """Get all boards, optionally filtered by project."""
-        arguments = {"project_key": project_key}
+    async def get_boards(project_key: str = "", start_at: int = 0, max_results: int = 50) -> dict:
+        """Get boards a page at a time, optionally filtered by project."""
+        arguments = {"project_key": project_key, "start_at": start_at, "max_results": max_results}
         result = await handle_get_boards(jira_service, arguments)
         return convert_result(result)
     
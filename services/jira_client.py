@@ -3,10 +3,38 @@ Jira Client Service
 Handles authentication and API interactions with Atlassian Jira
 """
 
+import asyncio
+import json
 import os
-from typing import Any, Dict, List, Optional, Union
+import random
+from typing import Any, Dict, List, Optional, Sequence, Union
 import httpx
 from atlassian import Jira
+from utils.jira_cache import ResponseCache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Project status definitions rarely change; cache them for 10 minutes
+PROJECT_STATUSES_TTL = 600.0
+
+# Boards are created and moved rarely; cache board listings for 5 minutes
+BOARDS_TTL = 300.0
+
+# Retries for requests rejected with 429 Too Many Requests. Jira Cloud sends a
+# Retry-After header with the delay to wait; when it is missing we back off
+# exponentially with jitter. Clients that pace themselves to the bucket described by
+# X-RateLimit-Interval-Seconds / X-RateLimit-FillRate avoid most 429s altogether.
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 1.0
+
+# Longest Retry-After we wait out; a longer requested delay returns the 429 instead,
+# since callers may hold shared concurrency slots while sleeping
+RATE_LIMIT_MAX_DELAY = 30.0
 
 
 class JiraService:
@@ -27,6 +55,7 @@ class JiraService:
         self.jira = None
         self._http_client = None
         self.headers = {"Content-Type": "application/json"}
+        self._response_cache = ResponseCache(maxsize=256)
 
     
     async def initialize(self):
@@ -40,13 +69,19 @@ class JiraService:
                 cloud=True
             )
             
-            # Initialize HTTP client for direct API calls
+            # Initialize HTTP client for direct API calls; connections are pooled
+            # and kept alive for the lifetime of the service
             self._http_client = httpx.AsyncClient(
                 auth=(self.email, self.token),
                 headers={
                     "Accept": "application/json",
                     "Content-Type": "application/json"
                 },
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=30,
+                    keepalive_expiry=60.0
+                ),
                 timeout=30.0
             )
             
@@ -71,8 +106,27 @@ class JiraService:
         if self._http_client:
             await self._http_client.aclose()
     
+    async def _post_with_retry(self, url: str, **kwargs: Any) -> httpx.Response:
+        """POST a request, retrying when Jira responds with 429 Too Many Requests."""
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            response = await self._http_client.post(url, **kwargs)
+            if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                return response
+            
+            try:
+                delay = float(response.headers["Retry-After"])
+            except (KeyError, ValueError):
+                delay = RATE_LIMIT_BACKOFF * 2 ** attempt
+            # Also rejects NaN; negative delays are treated as no delay
+            delay = max(delay, 0.0)
+            if not delay <= RATE_LIMIT_MAX_DELAY:
+                return response
+            await asyncio.sleep(delay + random.uniform(0, RATE_LIMIT_BACKOFF))
+        
+        return response
+    
     # Issue operations
-    async def get_issue(self, issue_key: str, fields: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> Dict[str, Any]:
+    async def get_issue(self, issue_key: str, fields: Optional[Sequence[str]] = None, expand: Optional[Sequence[str]] = None) -> Dict[str, Any]:
         """Get a specific issue by key."""
         params = {}
         if fields:
@@ -85,10 +139,10 @@ class JiraService:
             params=params
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
-    async def search_issues(self, jql: str, fields: Optional[List[str]] = None, expand: Optional[List[str]] = None, 
-                          start_at: int = 0, max_results: int = 50) -> Dict[str, Any]:
+    async def search_issues(self, jql: str, fields: Optional[Sequence[str]] = None, expand: Optional[Sequence[str]] = None, 
+                          start_at: int = 0, max_results: int = 50, next_page_token: Optional[str] = None) -> Dict[str, Any]:
         """Search for issues using JQL."""
         data = {
             "jql": jql,
@@ -99,13 +153,15 @@ class JiraService:
             data["fields"] = fields
         if expand:
             data["expand"] = expand
+        if next_page_token:
+            data["nextPageToken"] = next_page_token
         response = await self._http_client.get(
             f"{self.host}/rest/api/3/search/jql",
             headers=self.headers,
             params=data
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     async def create_issue(self, project_key: str, summary: str, description: str, issue_type: str, 
                           parent_key: Optional[str] = None, **kwargs) -> Dict[str, Any]:
@@ -145,7 +201,7 @@ class JiraService:
             json=data
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     async def update_issue(self, issue_key: str, fields: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing issue."""
@@ -186,7 +242,7 @@ class JiraService:
             f"{self.host}/rest/api/3/issue/{issue_key}/transitions"
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     async def transition_issue(self, issue_key: str, transition_id: str) -> Dict[str, Any]:
         """Transition an issue to a new status."""
@@ -194,7 +250,7 @@ class JiraService:
             "transition": {"id": transition_id}
         }
         
-        response = await self._http_client.post(
+        response = await self._post_with_retry(
             f"{self.host}/rest/api/3/issue/{issue_key}/transitions",
             json=data
         )
@@ -227,15 +283,25 @@ class JiraService:
             json=data
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
-    async def get_comments(self, issue_key: str) -> Dict[str, Any]:
-        """Get all comments for an issue."""
+    async def get_comments(self, issue_key: str, start_at: Optional[int] = None, max_results: Optional[int] = None,
+                           order_by: Optional[str] = None) -> Dict[str, Any]:
+        """Get comments for an issue, optionally a single page in a given order (e.g. '-created')."""
+        params = {}
+        if start_at is not None:
+            params["startAt"] = start_at
+        if max_results is not None:
+            params["maxResults"] = max_results
+        if order_by:
+            params["orderBy"] = order_by
+        
         response = await self._http_client.get(
-            f"{self.host}/rest/api/3/issue/{issue_key}/comment"
+            f"{self.host}/rest/api/3/issue/{issue_key}/comment",
+            params=params
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     # Worklog operations
     async def add_worklog(self, issue_key: str, time_spent: str, comment: Optional[str] = None, 
@@ -270,34 +336,52 @@ class JiraService:
             json=data
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     # Project operations
     async def get_projects(self) -> List[Dict[str, Any]]:
         """Get all projects."""
         response = await self._http_client.get(f"{self.host}/rest/api/3/project")
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     async def get_project_issue_types(self, project_key: str) -> List[Dict[str, Any]]:
         """Get issue types for a project."""
         response = await self._http_client.get(f"{self.host}/rest/api/3/project/{project_key}")
         response.raise_for_status()
-        project_data = response.json()
+        project_data = _json_loads(response.content)
         return project_data.get("issueTypes", [])
     
     async def get_project_statuses(self, project_key: str) -> List[Dict[str, Any]]:
-        """Get statuses for a project."""
-        response = await self._http_client.get(f"{self.host}/rest/api/3/project/{project_key}/statuses")
-        response.raise_for_status()
-        return response.json()
+        """Get statuses for a project (cached for PROJECT_STATUSES_TTL seconds)."""
+        async def fetch():
+            response = await self._http_client.get(f"{self.host}/rest/api/3/project/{project_key}/statuses")
+            response.raise_for_status()
+            return _json_loads(response.content)
+        
+        return await self._response_cache.cached_call(f"statuses:{project_key}", PROJECT_STATUSES_TTL, fetch)
     
     # Sprint operations (Agile API)
-    async def get_boards(self) -> Dict[str, Any]:
-        """Get all boards."""
-        response = await self._http_client.get(f"{self.host}/rest/agile/1.0/board")
-        response.raise_for_status()
-        return response.json()
+    async def get_boards(self, project_key_or_id: Optional[str] = None, start_at: int = 0, max_results: int = 50,
+                         use_cache: bool = True) -> Dict[str, Any]:
+        """Get a page of boards, optionally only those relevant to a project (cached for BOARDS_TTL seconds)."""
+        params = {
+            "startAt": start_at,
+            "maxResults": max_results
+        }
+        if project_key_or_id:
+            params["projectKeyOrId"] = project_key_or_id
+        
+        async def fetch():
+            response = await self._http_client.get(f"{self.host}/rest/agile/1.0/board", params=params)
+            response.raise_for_status()
+            return _json_loads(response.content)
+        
+        if not use_cache:
+            return await fetch()
+        return await self._response_cache.cached_call(
+            f"boards:{project_key_or_id or 'all'}:{start_at}:{max_results}", BOARDS_TTL, fetch
+        )
     
     async def get_board_sprints(self, board_id: int, state: Optional[str] = None) -> Dict[str, Any]:
         """Get sprints for a board."""
@@ -310,19 +394,26 @@ class JiraService:
             params=params
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     async def get_sprint(self, sprint_id: int) -> Dict[str, Any]:
         """Get a specific sprint."""
         response = await self._http_client.get(f"{self.host}/rest/agile/1.0/sprint/{sprint_id}")
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
-    async def get_sprint_issues(self, sprint_id: int) -> Dict[str, Any]:
+    async def get_sprint_issues(self, sprint_id: int, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
         """Get issues in a sprint."""
-        response = await self._http_client.get(f"{self.host}/rest/agile/1.0/sprint/{sprint_id}/issue")
+        params = {}
+        if fields:
+            params["fields"] = ",".join(fields)
+        
+        response = await self._http_client.get(
+            f"{self.host}/rest/agile/1.0/sprint/{sprint_id}/issue",
+            params=params
+        )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     async def move_issues_to_sprint(self, sprint_id: int, issue_keys: List[str]) -> Dict[str, Any]:
         """Move issues to a sprint."""
@@ -330,7 +421,7 @@ class JiraService:
             "issues": issue_keys
         }
         
-        response = await self._http_client.post(
+        response = await self._post_with_retry(
             f"{self.host}/rest/agile/1.0/sprint/{sprint_id}/issue",
             json=data
         )
@@ -366,5 +457,5 @@ class JiraService:
             params={"expand": "changelog"}
         )
         response.raise_for_status()
-        issue_data = response.json()
+        issue_data = _json_loads(response.content)
         return {"changelog": issue_data.get("changelog", {})}
@@ -5,7 +5,22 @@ Comment and Time Tracking Tool Handlers
 from typing import Any, Dict, List, Optional, Sequence
 from mcp.types import TextContent
 from services.jira_client import JiraService
-from utils.jira_formatter import format_jira_comment, format_jira_worklog
+from utils.jira_formatter import format_jira_comment, format_jira_worklog, format_items, truncate_text
+from utils.jira_validators import require_valid_issue_keys
+
+
+# Separator placed between comments
+_COMMENT_SEPARATOR = "\n\n" + "-"*40 + "\n\n"
+
+# Help appended to worklog errors
+_TIME_FORMAT_HELP = (
+    "💡 **Time Format Examples**:\n"
+    "- `3h` (3 hours)\n"
+    "- `30m` (30 minutes)\n"
+    "- `1h 30m` (1 hour 30 minutes)\n"
+    "- `2d` (2 days)\n"
+    "- `1d 4h` (1 day 4 hours)"
+)
 
 
 async def handle_add_comment(jira_service: JiraService, arguments: Dict[str, Any]) -> Sequence[TextContent]:
@@ -16,11 +31,14 @@ async def handle_add_comment(jira_service: JiraService, arguments: Dict[str, Any
         
         if not all([issue_key, comment]):
             return [TextContent(type="text", text="❌ issue_key and comment are required")]
+        invalid = require_valid_issue_keys(issue_key)
+        if invalid:
+            return invalid
         
         result = await jira_service.add_comment(issue_key=issue_key, comment=comment)
         
         success_msg = f"✅ Successfully added comment to {issue_key}\n"
-        success_msg += f"💬 Comment: {comment[:100]}{'...' if len(comment) > 100 else ''}"
+        success_msg += f"💬 Comment: {truncate_text(comment)}"
         
         return [TextContent(type="text", text=success_msg)]
         
@@ -34,19 +52,22 @@ async def handle_get_comments(jira_service: JiraService, arguments: Dict[str, An
         issue_key = arguments.get("issue_key")
         if not issue_key:
             return [TextContent(type="text", text="❌ issue_key is required")]
+        invalid = require_valid_issue_keys(issue_key)
+        if invalid:
+            return invalid
         
         max_results = arguments.get("max_results", 20)
         
-        comments_response = await jira_service.get_comments(issue_key)
+        # Only fetch the most recent comments, newest first
+        comments_response = await jira_service.get_comments(issue_key, max_results=max_results, order_by="-created")
         comments = comments_response.get("comments", [])
         total = comments_response.get("total", 0)
         
         if not comments:
             return [TextContent(type="text", text=f"No comments found for issue {issue_key}")]
         
-        # Limit results if requested
-        if len(comments) > max_results:
-            comments = comments[-max_results:]  # Get most recent comments
+        # Show them in chronological order
+        comments.reverse()
         
         output = []
         if total > len(comments):
@@ -55,12 +76,8 @@ async def handle_get_comments(jira_service: JiraService, arguments: Dict[str, An
             output.append(f"💬 **Comments for {issue_key}**: {len(comments)} comment{'s' if len(comments) != 1 else ''}\n")
         
         # Format each comment
-        for i, comment in enumerate(comments):
-            formatted_comment = format_jira_comment(comment)
-            output.append(formatted_comment)
-            
-            if i < len(comments) - 1:
-                output.append("\n" + "-"*40 + "\n")
+        formatted_comments = await format_items(format_jira_comment, comments)
+        output.append(_COMMENT_SEPARATOR.join(formatted_comments))
         
         if total > len(comments):
             remaining = total - len(comments)
@@ -80,6 +97,9 @@ async def handle_add_worklog(jira_service: JiraService, arguments: Dict[str, Any
         
         if not all([issue_key, time_spent]):
             return [TextContent(type="text", text="❌ issue_key and time_spent are required")]
+        invalid = require_valid_issue_keys(issue_key)
+        if invalid:
+            return invalid
         
         comment = arguments.get("comment")
         started = arguments.get("started")
@@ -91,21 +111,16 @@ async def handle_add_worklog(jira_service: JiraService, arguments: Dict[str, Any
             started=started
         )
         
-        success_msg = f"✅ Successfully logged time for {issue_key}\n"
-        success_msg += f"⏱️  Time: {time_spent}"
+        success_parts = [
+            f"✅ Successfully logged time for {issue_key}",
+            f"⏱️  Time: {time_spent}"
+        ]
         if comment:
-            success_msg += f"\n💭 Comment: {comment}"
+            success_parts.append(f"💭 Comment: {truncate_text(comment)}")
         if started:
-            success_msg += f"\n📅 Started: {started}"
+            success_parts.append(f"📅 Started: {started}")
         
-        return [TextContent(type="text", text=success_msg)]
+        return [TextContent(type="text", text="\n".join(success_parts))]
         
     except Exception as e:
-        error_msg = f"❌ Failed to add worklog: {str(e)}\n\n"
-        error_msg += "💡 **Time Format Examples**:\n"
-        error_msg += "- `3h` (3 hours)\n"
-        error_msg += "- `30m` (30 minutes)\n"
-        error_msg += "- `1h 30m` (1 hour 30 minutes)\n"
-        error_msg += "- `2d` (2 days)\n"
-        error_msg += "- `1d 4h` (1 day 4 hours)"
-        return [TextContent(type="text", text=error_msg)]
+        return [TextContent(type="text", text=f"❌ Failed to add worklog: {str(e)}\n\n{_TIME_FORMAT_HELP}")]
@@ -12,7 +12,7 @@ from services.jira_client import JiraService
 from .tool_handlers import (
     handle_get_issue, handle_create_issue, handle_create_child_issue,
     handle_update_issue, handle_search_issues, handle_list_issue_types,
-    handle_transition_issue
+    handle_transition_issue, handle_batch_transition_issues
 )
 from .comment_time_handlers import (
     handle_add_comment, handle_get_comments, handle_add_worklog
@@ -82,17 +82,18 @@ def register_comprehensive_jira_tools(server: Server, jira_service: JiraService)
             ),
             Tool(
                 name="update_issue",
-                description="Update an existing Jira issue with partial field updates",
+                description="Update one or more existing Jira issues with partial field updates",
                 inputSchema={
                     "type": "object",
                     "properties": {
                         "issue_key": {"type": "string", "description": "The Jira issue key to update"},
+                        "issue_keys": {"type": "array", "items": {"type": "string"}, "description": "Further issue keys to apply the same update to (optional)"},
                         "summary": {"type": "string", "description": "New summary/title (optional)"},
                         "description": {"type": "string", "description": "New description (optional)"},
                         "priority": {"type": "string", "description": "New priority (optional)"},
                         "assignee": {"type": "string", "description": "New assignee (optional)"}
                     },
-                    "required": ["issue_key"]
+                    "required": []
                 }
             ),
             Tool(
@@ -104,7 +105,7 @@ def register_comprehensive_jira_tools(server: Server, jira_service: JiraService)
                         "jql": {"type": "string", "description": "JQL query string"},
                         "fields": {"type": "string", "description": "Comma-separated list of fields to retrieve (optional)"},
                         "expand": {"type": "string", "description": "Comma-separated list of fields to expand (optional)"},
-                        "max_results": {"type": "integer", "description": "Maximum number of results (default: 30, max: 100)"}
+                        "max_results": {"type": "integer", "description": "Maximum number of results (default: 30, max: 500)"}
                     },
                     "required": ["jql"]
                 }
@@ -132,6 +133,28 @@ def register_comprehensive_jira_tools(server: Server, jira_service: JiraService)
                     "required": ["issue_key", "transition_name"]
                 }
             ),
+            Tool(
+                name="batch_transition_issues",
+                description="Transition several issues at once; lookups and transitions run concurrently and individual failures are reported per issue",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "items": {
+                            "type": "array",
+                            "description": "Issues to transition",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "issue_key": {"type": "string", "description": "The Jira issue key to transition"},
+                                    "transition_name": {"type": "string", "description": "The name of the transition to perform"}
+                                },
+                                "required": ["issue_key", "transition_name"]
+                            }
+                        }
+                    },
+                    "required": ["items"]
+                }
+            ),
             
             # Comments & Time Tracking Tools
             Tool(
@@ -250,7 +273,7 @@ def register_comprehensive_jira_tools(server: Server, jira_service: JiraService)
             ),
             Tool(
                 name="move_issues_to_sprint",
-                description="Move issues to sprints with bulk operations support (up to 50 issues at once)",
+                description="Move issues to sprints with bulk operations support (large lists are sent in batches of 50)",
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -277,7 +300,9 @@ def register_comprehensive_jira_tools(server: Server, jira_service: JiraService)
                 inputSchema={
                     "type": "object",
                     "properties": {
-                        "project_key": {"type": "string", "description": "Filter boards by project key (optional)"}
+                        "project_key": {"type": "string", "description": "Filter boards by project key (optional)"},
+                        "start_at": {"type": "integer", "description": "Index of the first board to return (default: 0)"},
+                        "max_results": {"type": "integer", "description": "Maximum number of boards to return (default: 50, max: 50)"}
                     },
                     "required": []
                 }
@@ -303,6 +328,8 @@ def register_comprehensive_jira_tools(server: Server, jira_service: JiraService)
             return await handle_list_issue_types(jira_service, arguments)
         elif name == "transition_issue":
             return await handle_transition_issue(jira_service, arguments)
+        elif name == "batch_transition_issues":
+            return await handle_batch_transition_issues(jira_service, arguments)
         
         # Comments & Time Tracking Tools
         elif name == "add_comment":
@@ -2,11 +2,64 @@
 Project Management Tool Handlers
 """
 
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+import httpx
 from mcp.types import TextContent
 from services.jira_client import JiraService
 
 
+# Icons used for each status category
+_CATEGORY_ICON = {
+    "Done": "✅",
+    "In Progress": "🔄",
+    "To Do": "📋",
+}
+
+# Separator emitted after each issue type's statuses
+_STATUS_GROUP_SEPARATOR = "\n" + "-"*40 + "\n"
+
+
+def _render_statuses(statuses: List[Dict[str, Any]], project_key: str) -> Iterator[str]:
+    """Yield the output lines for a project's statuses grouped by issue type."""
+    yield f"📊 **Statuses for Project {project_key}**\n"
+    
+    for status_group in statuses:
+        # Get issue type information
+        issue_type = status_group.get("issueType", {})
+        issue_type_name = issue_type.get("name", "Unknown")
+        issue_type_description = issue_type.get("description", "")
+        
+        # Add issue type header
+        yield f"🏷️  **{issue_type_name}**"
+        if issue_type_description:
+            yield f"   {issue_type_description}"
+        yield ""
+        
+        # List statuses for this issue type
+        statuses_list = status_group.get("statuses", [])
+        if statuses_list:
+            for i, status in enumerate(statuses_list):
+                name = status.get("name", "Unknown")
+                description = status.get("description", "")
+                category = status.get("statusCategory", {}).get("name", "")
+                
+                # Use different icons based on status category
+                icon = _CATEGORY_ICON.get(category, "📊")
+                
+                yield f"   {icon} **{name}**"
+                if description:
+                    yield f"      {description}"
+                if category:
+                    yield f"      Category: {category}"
+                
+                if i < len(statuses_list) - 1:
+                    yield ""
+        else:
+            yield "   No statuses available"
+        
+        yield _STATUS_GROUP_SEPARATOR
+
+
 async def handle_list_project_statuses(jira_service: JiraService, arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """Handle list_project_statuses tool call."""
     try:
@@ -19,52 +72,7 @@ async def handle_list_project_statuses(jira_service: JiraService, arguments: Dic
         if not statuses:
             return [TextContent(type="text", text=f"No statuses found for project {project_key}")]
         
-        output = [f"📊 **Statuses for Project {project_key}**\n"]
-        
-        for status_group in statuses:
-            # Get issue type information
-            issue_type = status_group.get("issueType", {})
-            issue_type_name = issue_type.get("name", "Unknown")
-            issue_type_description = issue_type.get("description", "")
-            
-            # Add issue type header
-            output.append(f"🏷️  **{issue_type_name}**")
-            if issue_type_description:
-                output.append(f"   {issue_type_description}")
-            output.append("")
-            
-            # List statuses for this issue type
-            statuses_list = status_group.get("statuses", [])
-            if statuses_list:
-                for i, status in enumerate(statuses_list):
-                    name = status.get("name", "Unknown")
-                    description = status.get("description", "")
-                    category = status.get("statusCategory", {}).get("name", "")
-                    
-                    # Use different icons based on status category
-                    if category == "Done":
-                        icon = "✅"
-                    elif category == "In Progress":
-                        icon = "🔄"
-                    elif category == "To Do":
-                        icon = "📋"
-                    else:
-                        icon = "📊"
-                    
-                    output.append(f"   {icon} **{name}**")
-                    if description:
-                        output.append(f"      {description}")
-                    if category:
-                        output.append(f"      Category: {category}")
-                    
-                    if i < len(statuses_list) - 1:
-                        output.append("")
-            else:
-                output.append("   No statuses available")
-            
-            output.append("\n" + "-"*40 + "\n")
-        
-        return [TextContent(type="text", text="\n".join(output))]
+        return [TextContent(type="text", text="\n".join(_render_statuses(statuses, project_key)))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"❌ Failed to get project statuses: {str(e)}")]
@@ -74,30 +82,43 @@ async def handle_get_boards(jira_service: JiraService, arguments: Dict[str, Any]
     """Handle get_boards tool call."""
     try:
         project_key = arguments.get("project_key")
+        start_at = arguments.get("start_at") or 0
+        max_results = min(arguments.get("max_results") or 50, 50)
         
-        boards_response = await jira_service.get_boards()
+        # Let Jira narrow the listing to boards relevant to the project; it rejects
+        # keys that are not real projects, which therefore have no boards
+        try:
+            boards_response = await jira_service.get_boards(
+                project_key_or_id=project_key,
+                start_at=start_at,
+                max_results=max_results
+            )
+        except httpx.HTTPStatusError as e:
+            if project_key and e.response.status_code in (400, 404):
+                return [TextContent(type="text", text=f"No boards found for project {project_key}")]
+            raise
         boards = boards_response.get("values", [])
+        has_more = not boards_response.get("isLast", True)
+        next_start_at = start_at + len(boards)
         
-        if not boards:
+        if not boards and not project_key:
             return [TextContent(type="text", text="No boards found")]
         
-        # Filter by project if specified
+        # Keep only boards located in the project itself
         if project_key:
-            filtered_boards = []
-            for board in boards:
-                location = board.get("location", {})
-                if location.get("projectKey") == project_key:
-                    filtered_boards.append(board)
-            boards = filtered_boards
+            boards = [board for board in boards if board.get("location", {}).get("projectKey") == project_key]
             
             if not boards:
+                # Boards of the project may still be on a later page
+                if has_more:
+                    return [TextContent(type="text", text=f"No boards for project {project_key} on this page. More boards available; use start_at={next_start_at} to see the next page.")]
                 return [TextContent(type="text", text=f"No boards found for project {project_key}")]
         
         output = []
         if project_key:
             output.append(f"📋 **Boards for Project {project_key}**\n")
         else:
-            output.append(f"📋 **All Boards ({len(boards)} total)**\n")
+            output.append(f"📋 **All Boards ({boards_response.get('total', len(boards))} total)**\n")
         
         for i, board in enumerate(boards):
             board_id = board.get("id", "Unknown")
@@ -114,6 +135,9 @@ async def handle_get_boards(jira_service: JiraService, arguments: Dict[str, Any]
             if i < len(boards) - 1:
                 output.append("")
         
+        if has_more:
+            output.append(f"\n💡 **Note**: More boards available. Use start_at={next_start_at} to see the next page.")
+        
         return [TextContent(type="text", text="\n".join(output))]
         
     except Exception as e:
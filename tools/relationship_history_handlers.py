@@ -2,10 +2,60 @@
 Issue Relationship and History Tool Handlers
 """
 
-from typing import Any, Dict, List, Optional, Sequence
+import heapq
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 from mcp.types import TextContent
 from services.jira_client import JiraService
-from utils.jira_formatter import format_issue_link, format_changelog_entry
+from utils.jira_formatter import format_issue_link, format_changelog_entry, format_items
+from utils.jira_validators import require_valid_issue_keys
+
+
+# Help appended to link errors
+_LINK_TYPES_HELP = (
+    "💡 **Common Link Types**:\n"
+    "- `Blocks` - First issue blocks the second\n"
+    "- `Cloners` - Issues are clones of each other\n"
+    "- `Duplicate` - Issues are duplicates\n"
+    "- `Relates` - Issues are related\n"
+    "- `Causes` - First issue causes the second"
+)
+
+# Separator placed between history entries
+_HISTORY_SEPARATOR = "\n\n" + "-"*50 + "\n\n"
+
+
+def _render_related_issues(issue_key: str, issue_links: List[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the output lines for an issue's links grouped by link type."""
+    yield f"🔗 **Related Issues for {issue_key}**\n"
+    
+    # Group links by type
+    link_groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for link in issue_links:
+        type_name = link.get("type", {}).get("name", "Unknown")
+        link_groups[type_name].append(link)
+    
+    # Format each group as a single block followed by a blank line
+    for link_type, links in link_groups.items():
+        link_lines = "\n".join(f"  {i}. {format_issue_link(link)}" for i, link in enumerate(links, 1))
+        yield f"📋 **{link_type} ({len(links)})**\n\n{link_lines}\n"
+    
+    total_links = len(issue_links)
+    yield f"📊 **Summary**: {total_links} related issue{'s' if total_links != 1 else ''} found"
+
+
+def _render_history(issue_key: str, entries: List[str], total: int) -> Iterator[str]:
+    """Yield the output lines for an issue's formatted change history entries."""
+    if total > len(entries):
+        yield f"📜 **History for {issue_key}**: Showing {len(entries)} of {total} entries (most recent)\n"
+    else:
+        yield f"📜 **History for {issue_key}**: {len(entries)} entr{'ies' if len(entries) != 1 else 'y'}\n"
+    
+    yield _HISTORY_SEPARATOR.join(entries)
+    
+    if total > len(entries):
+        remaining = total - len(entries)
+        yield f"\n💡 **Note**: {remaining} older entr{'ies' if remaining != 1 else 'y'} not shown."
 
 
 async def handle_link_issues(jira_service: JiraService, arguments: Dict[str, Any]) -> Sequence[TextContent]:
@@ -18,28 +68,27 @@ async def handle_link_issues(jira_service: JiraService, arguments: Dict[str, Any
         if not all([inward_issue, outward_issue, link_type]):
             return [TextContent(type="text", text="❌ inward_issue, outward_issue, and link_type are required")]
         
+        invalid = require_valid_issue_keys(inward_issue, outward_issue)
+        if invalid:
+            return invalid
+        
         await jira_service.link_issues(
             inward_issue=inward_issue,
             outward_issue=outward_issue,
             link_type=link_type
         )
         
-        success_msg = f"✅ Successfully linked issues\n"
-        success_msg += f"🔗 Link Type: {link_type}\n"
-        success_msg += f"📥 Inward Issue: {inward_issue}\n"
-        success_msg += f"📤 Outward Issue: {outward_issue}"
+        success_parts = [
+            "✅ Successfully linked issues",
+            f"🔗 Link Type: {link_type}",
+            f"📥 Inward Issue: {inward_issue}",
+            f"📤 Outward Issue: {outward_issue}"
+        ]
         
-        return [TextContent(type="text", text=success_msg)]
+        return [TextContent(type="text", text="\n".join(success_parts))]
         
     except Exception as e:
-        error_msg = f"❌ Failed to link issues: {str(e)}\n\n"
-        error_msg += "💡 **Common Link Types**:\n"
-        error_msg += "- `Blocks` - First issue blocks the second\n"
-        error_msg += "- `Cloners` - Issues are clones of each other\n"
-        error_msg += "- `Duplicate` - Issues are duplicates\n"
-        error_msg += "- `Relates` - Issues are related\n"
-        error_msg += "- `Causes` - First issue causes the second"
-        return [TextContent(type="text", text=error_msg)]
+        return [TextContent(type="text", text=f"❌ Failed to link issues: {str(e)}\n\n{_LINK_TYPES_HELP}")]
 
 
 async def handle_get_related_issues(jira_service: JiraService, arguments: Dict[str, Any]) -> Sequence[TextContent]:
@@ -48,6 +97,9 @@ async def handle_get_related_issues(jira_service: JiraService, arguments: Dict[s
         issue_key = arguments.get("issue_key")
         if not issue_key:
             return [TextContent(type="text", text="❌ issue_key is required")]
+        invalid = require_valid_issue_keys(issue_key)
+        if invalid:
+            return invalid
         
         links_response = await jira_service.get_issue_links(issue_key)
         issue_links = links_response.get("issuelinks", [])
@@ -55,33 +107,7 @@ async def handle_get_related_issues(jira_service: JiraService, arguments: Dict[s
         if not issue_links:
             return [TextContent(type="text", text=f"No related issues found for {issue_key}")]
         
-        output = [f"🔗 **Related Issues for {issue_key}**\n"]
-        
-        # Group links by type
-        link_groups = {}
-        for link in issue_links:
-            link_type = link.get("type", {})
-            type_name = link_type.get("name", "Unknown")
-            
-            if type_name not in link_groups:
-                link_groups[type_name] = []
-            link_groups[type_name].append(link)
-        
-        # Format each group
-        for link_type, links in link_groups.items():
-            output.append(f"📋 **{link_type} ({len(links)})**")
-            output.append("")
-            
-            for i, link in enumerate(links):
-                formatted_link = format_issue_link(link)
-                output.append(f"  {i+1}. {formatted_link}")
-            
-            output.append("")
-        
-        total_links = len(issue_links)
-        output.append(f"📊 **Summary**: {total_links} related issue{'s' if total_links != 1 else ''} found")
-        
-        return [TextContent(type="text", text="\n".join(output))]
+        return [TextContent(type="text", text="\n".join(_render_related_issues(issue_key, issue_links)))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"❌ Failed to get related issues: {str(e)}")]
@@ -93,6 +119,9 @@ async def handle_get_issue_history(jira_service: JiraService, arguments: Dict[st
         issue_key = arguments.get("issue_key")
         if not issue_key:
             return [TextContent(type="text", text="❌ issue_key is required")]
+        invalid = require_valid_issue_keys(issue_key)
+        if invalid:
+            return invalid
         
         max_results = arguments.get("max_results", 20)
         
@@ -104,32 +133,11 @@ async def handle_get_issue_history(jira_service: JiraService, arguments: Dict[st
         if not histories:
             return [TextContent(type="text", text=f"No history found for issue {issue_key}")]
         
-        # Limit results if requested (get most recent entries)
-        if len(histories) > max_results:
-            histories = histories[-max_results:]
-        
-        # Sort by created date (most recent first)
-        histories.sort(key=lambda x: x.get("created", ""), reverse=True)
-        
-        output = []
-        if total > len(histories):
-            output.append(f"📜 **History for {issue_key}**: Showing {len(histories)} of {total} entries (most recent)\n")
-        else:
-            output.append(f"📜 **History for {issue_key}**: {len(histories)} entr{'ies' if len(histories) != 1 else 'y'}\n")
-        
-        # Format each history entry
-        for i, history in enumerate(histories):
-            formatted_entry = format_changelog_entry(history)
-            output.append(formatted_entry)
-            
-            if i < len(histories) - 1:
-                output.append("\n" + "-"*50 + "\n")
-        
-        if total > len(histories):
-            remaining = total - len(histories)
-            output.append(f"\n💡 **Note**: {remaining} older entr{'ies' if remaining != 1 else 'y'} not shown.")
+        # Keep the most recent entries, newest first
+        histories = heapq.nlargest(max_results, histories, key=lambda x: x.get("created", ""))
         
-        return [TextContent(type="text", text="\n".join(output))]
+        entries = await format_items(format_changelog_entry, histories)
+        return [TextContent(type="text", text="\n".join(_render_history(issue_key, entries, total)))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"❌ Failed to get issue history: {str(e)}")]
@@ -2,32 +2,197 @@
 Sprint and Project Management Tool Handlers
 """
 
-from typing import Any, Dict, List, Optional, Sequence
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 from mcp.types import TextContent
 from services.jira_client import JiraService
-from utils.jira_formatter import format_jira_sprint, format_jira_issue
+from utils.jira_formatter import format_jira_sprint, format_jira_issue, format_items
+from utils.jira_validators import require_valid_issue_keys, require_valid_sprint_id
+
+
+# Board ids resolved from project keys, cached for five minutes. Lookups bypass the
+# service's board listing cache so that evicting an id here forces a fresh fetch.
+_BOARD_ID_TTL = 300.0
+_board_id_cache: Dict[str, Tuple[float, int]] = {}
+_board_id_lookups: Dict[str, asyncio.Future] = {}
+
+# Boards fetched per request when scanning every board (the agile API maximum)
+_BOARD_PAGE_SIZE = 50
+
+# Jira's agile API accepts at most 50 issues per move request; moves from all
+# callers share one limit on in-flight requests to stay clear of rate limiting
+_MOVE_BATCH_SIZE = 50
+_MOVE_SEMAPHORE = asyncio.Semaphore(3)
+
+# Fields read by _format_issue_row; sprint issue listings request only these
+_SPRINT_ISSUE_FIELDS = ("summary", "status", "assignee")
+
+# Separator placed between sprints in a listing
+_SPRINT_SEPARATOR = "\n\n" + "-"*30 + "\n\n"
+
+
+def _index_boards(boards: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index boards by the key of the project they are located in, keeping the first board per project."""
+    board_index: Dict[str, Dict[str, Any]] = {}
+    for board in boards:
+        board_project_key = board.get("location", {}).get("projectKey")
+        if board_project_key and board.get("id"):
+            board_index.setdefault(board_project_key, board)
+    return board_index
+
+
+def _match_board(boards: List[Dict[str, Any]], project_key: str) -> Optional[int]:
+    """Pick the board located in the project, falling back to a name match."""
+    board = _index_boards(boards).get(project_key)
+    if board:
+        return board["id"]
+    
+    return _match_board_by_name(boards, project_key)
+
+
+def _match_board_by_name(boards: List[Dict[str, Any]], project_key: str) -> Optional[int]:
+    """Pick the first board whose name mentions the project key."""
+    project_key_lower = project_key.lower()
+    for board in boards:
+        board_name = board.get("name", "").lower()
+        if project_key_lower in board_name:
+            return board.get("id")
+    
+    return None
+
+
+def _get_cached_board_id(project_key: str) -> Optional[int]:
+    """Return the cached board ID for a project if it has not expired."""
+    cached = _board_id_cache.get(project_key)
+    if cached and time.monotonic() - cached[0] < _BOARD_ID_TTL:
+        return cached[1]
+    return None
+
+
+def _cache_project_boards(board_index: Dict[str, Dict[str, Any]], seen_projects: Set[str]) -> None:
+    """Cache the board of every project in a board index not already cached by this scan."""
+    now = time.monotonic()
+    for board_project_key, board in board_index.items():
+        if board_project_key not in seen_projects:
+            seen_projects.add(board_project_key)
+            _board_id_cache[board_project_key] = (now, board["id"])
+
+
+async def _scan_boards_for_project(jira_service: JiraService, project_key: str) -> Optional[int]:
+    """Page through all boards until one located in the project is found."""
+    scanned_boards: List[Dict[str, Any]] = []
+    # Projects cached so far, so a project's first board is not overwritten by later pages
+    seen_projects: Set[str] = set()
+    start_at = 0
+    while True:
+        boards_response = await jira_service.get_boards(start_at=start_at, max_results=_BOARD_PAGE_SIZE, use_cache=False)
+        boards = boards_response.get("values", [])
+        board_index = _index_boards(boards)
+        _cache_project_boards(board_index, seen_projects)
+        
+        board = board_index.get(project_key)
+        if board:
+            return board["id"]
+        
+        scanned_boards.extend(boards)
+        start_at += len(boards)
+        if not boards or boards_response.get("isLast", True):
+            break
+    
+    # No board is located in the project; fall back to a name match
+    return _match_board_by_name(scanned_boards, project_key)
 
 
 async def _get_board_id_from_project(jira_service: JiraService, project_key: str) -> Optional[int]:
     """Helper function to get board ID from project key."""
+    board_id = _get_cached_board_id(project_key)
+    if board_id:
+        return board_id
+    
+    # Concurrent lookups for the same project share one in-flight request, which
+    # is forgotten as soon as it finishes
+    lookup = _board_id_lookups.get(project_key)
+    if lookup is None:
+        lookup = asyncio.ensure_future(_lookup_board_id(jira_service, project_key))
+        _board_id_lookups[project_key] = lookup
+        lookup.add_done_callback(lambda _: _board_id_lookups.pop(project_key, None))
+    return await asyncio.shield(lookup)
+
+
+async def _lookup_board_id(jira_service: JiraService, project_key: str) -> Optional[int]:
+    """Resolve a project's board ID from Jira and cache it."""
+    # Let Jira filter boards by project first; it rejects keys that are not real
+    # projects, which still need the board name fallback below
     try:
-        boards_response = await jira_service.get_boards()
+        boards_response = await jira_service.get_boards(project_key_or_id=project_key, use_cache=False)
         boards = boards_response.get("values", [])
-        
-        for board in boards:
-            location = board.get("location", {})
-            if location.get("projectKey") == project_key:
-                return board.get("id")
-        
-        # If no exact match, try to find a board that might be related
-        for board in boards:
-            board_name = board.get("name", "").lower()
-            if project_key.lower() in board_name:
-                return board.get("id")
-        
-        return None
+        board_id = _match_board(boards, project_key) or (boards[0].get("id") if boards else None)
     except Exception:
-        return None
+        board_id = None
+    
+    # Fall back to scanning every board page by page, remembering the board of
+    # every project seen and stopping as soon as the project's board turns up
+    if not board_id:
+        try:
+            board_id = await _scan_boards_for_project(jira_service, project_key)
+        except Exception:
+            return None
+    
+    if board_id:
+        _board_id_cache[project_key] = (time.monotonic(), board_id)
+    return board_id
+
+
+def _format_issue_row(i: int, issue: Dict[str, Any]) -> str:
+    """Format a single issue as a numbered row of a sprint issue listing."""
+    # Built directly rather than via format_jira_issue, which would also render the
+    # ADF description and other sections that sprint listings do not show
+    fields = issue.get("fields") or {}
+    assignee = fields.get("assignee") or {}
+    status = (fields.get("status") or {}).get("name", "Unknown")
+    return (
+        f"  {i+1}. **{issue.get('key', 'Unknown')}**: {fields.get('summary', 'No summary')}\n"
+        f"     📊 Status: {status} | 👤 Assignee: {assignee.get('displayName', 'Unassigned')}"
+    )
+
+
+def _format_sprint_details(sprint: Dict[str, Any], issues: List[Dict[str, Any]], issues_error: Optional[Exception] = None) -> str:
+    """Format a sprint together with the issues it contains."""
+    output = []
+    formatted_sprint = format_jira_sprint(sprint)
+    output.append(formatted_sprint)
+    
+    # Add issues in the sprint
+    if issues_error:
+        output.append(f"\n⚠️ **Could not load sprint issues**: {str(issues_error)}")
+    elif issues:
+        output.append(f"\n📋 **Issues in Sprint ({len(issues)} total)**\n")
+        
+        output.append("\n\n".join(_format_issue_row(i, issue) for i, issue in enumerate(issues)))
+    else:
+        output.append("\n📋 **No issues in this sprint**")
+    
+    return "\n".join(output)
+
+
+async def _get_sprint_details(jira_service: JiraService, sprint_id: int) -> str:
+    """Fetch a sprint and its issues concurrently and format them."""
+    sprint, sprint_issues_response = await asyncio.gather(
+        jira_service.get_sprint(sprint_id),
+        jira_service.get_sprint_issues(sprint_id, fields=_SPRINT_ISSUE_FIELDS),
+        return_exceptions=True
+    )
+    
+    # Without the sprint itself there is nothing to show
+    if isinstance(sprint, Exception):
+        raise sprint
+    
+    # Still show the sprint if only the issue listing failed
+    if isinstance(sprint_issues_response, Exception):
+        return _format_sprint_details(sprint, [], issues_error=sprint_issues_response)
+    
+    return _format_sprint_details(sprint, sprint_issues_response.get("issues", []))
 
 
 async def handle_list_sprints(jira_service: JiraService, arguments: Dict[str, Any]) -> Sequence[TextContent]:
@@ -57,16 +222,15 @@ async def handle_list_sprints(jira_service: JiraService, arguments: Dict[str, An
         state_filter = f" ({state})" if state else ""
         output.append(f"🏃 **Sprints for Board {board_id}{state_filter}**\n")
         
-        for i, sprint in enumerate(sprints):
-            formatted_sprint = format_jira_sprint(sprint)
-            output.append(formatted_sprint)
-            
-            if i < len(sprints) - 1:
-                output.append("\n" + "-"*30 + "\n")
+        formatted_sprints = await format_items(format_jira_sprint, sprints)
+        output.append(_SPRINT_SEPARATOR.join(formatted_sprints))
         
         return [TextContent(type="text", text="\n".join(output))]
         
     except Exception as e:
+        # The cached board may be gone or no longer accessible
+        if project_key:
+            _board_id_cache.pop(project_key, None)
         return [TextContent(type="text", text=f"❌ Failed to list sprints: {str(e)}")]
 
 
@@ -96,9 +260,12 @@ async def handle_get_active_sprint(jira_service: JiraService, arguments: Dict[st
         sprint_id = active_sprint.get("id")
         
         # Get detailed sprint information with issues
-        return await handle_get_sprint(jira_service, {"sprint_id": sprint_id})
+        return [TextContent(type="text", text=await _get_sprint_details(jira_service, sprint_id))]
         
     except Exception as e:
+        # The cached board may be gone or no longer accessible
+        if project_key:
+            _board_id_cache.pop(project_key, None)
         return [TextContent(type="text", text=f"❌ Failed to get active sprint: {str(e)}")]
 
 
@@ -108,39 +275,11 @@ async def handle_get_sprint(jira_service: JiraService, arguments: Dict[str, Any]
         sprint_id = arguments.get("sprint_id")
         if not sprint_id:
             return [TextContent(type="text", text="❌ sprint_id is required")]
+        invalid = require_valid_sprint_id(sprint_id)
+        if invalid:
+            return invalid
         
-        # Get sprint details
-        sprint = await jira_service.get_sprint(sprint_id)
-        
-        # Get issues in the sprint
-        sprint_issues_response = await jira_service.get_sprint_issues(sprint_id)
-        issues = sprint_issues_response.get("issues", [])
-        
-        output = []
-        formatted_sprint = format_jira_sprint(sprint)
-        output.append(formatted_sprint)
-        
-        # Add issues in the sprint
-        if issues:
-            output.append(f"\n📋 **Issues in Sprint ({len(issues)} total)**\n")
-            
-            for i, issue in enumerate(issues):
-                key = issue.get("key", "Unknown")
-                fields = issue.get("fields", {})
-                summary = fields.get("summary", "No summary")
-                status = fields.get("status", {}).get("name", "Unknown")
-                assignee = fields.get("assignee")
-                assignee_name = assignee.get("displayName", "Unassigned") if assignee else "Unassigned"
-                
-                output.append(f"  {i+1}. **{key}**: {summary}")
-                output.append(f"     📊 Status: {status} | 👤 Assignee: {assignee_name}")
-                
-                if i < len(issues) - 1:
-                    output.append("")
-        else:
-            output.append("\n📋 **No issues in this sprint**")
-        
-        return [TextContent(type="text", text="\n".join(output))]
+        return [TextContent(type="text", text=await _get_sprint_details(jira_service, sprint_id))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"❌ Failed to get sprint: {str(e)}")]
@@ -154,21 +293,46 @@ async def handle_move_issues_to_sprint(jira_service: JiraService, arguments: Dic
         
         if not sprint_id:
             return [TextContent(type="text", text="❌ sprint_id is required")]
+        invalid = require_valid_sprint_id(sprint_id)
+        if invalid:
+            return invalid
         
         if not issue_keys:
             return [TextContent(type="text", text="❌ issue_keys list is required")]
         
-        # Limit the number of issues to prevent overwhelming the API
-        if len(issue_keys) > 50:
-            return [TextContent(type="text", text="❌ Cannot move more than 50 issues at once. Please split into smaller batches.")]
+        # Drop repeated keys, keeping the first occurrence of each
+        requested_count = len(issue_keys)
+        issue_keys = list(dict.fromkeys(issue_keys))
+        duplicates_removed = requested_count - len(issue_keys)
         
-        await jira_service.move_issues_to_sprint(sprint_id=sprint_id, issue_keys=issue_keys)
+        invalid = require_valid_issue_keys(*issue_keys)
+        if invalid:
+            return invalid
         
-        issue_list = ", ".join(issue_keys)
-        success_msg = f"✅ Successfully moved {len(issue_keys)} issue{'s' if len(issue_keys) != 1 else ''} to sprint {sprint_id}\n"
-        success_msg += f"📋 Issues moved: {issue_list}"
+        # Split into API-sized batches and move them concurrently
+        chunks = [issue_keys[i:i + _MOVE_BATCH_SIZE] for i in range(0, len(issue_keys), _MOVE_BATCH_SIZE)]
+        async def move_chunk(chunk: List[str]) -> None:
+            async with _MOVE_SEMAPHORE:
+                await jira_service.move_issues_to_sprint(sprint_id=sprint_id, issue_keys=chunk)
         
-        return [TextContent(type="text", text=success_msg)]
+        results = await asyncio.gather(*(move_chunk(chunk) for chunk in chunks), return_exceptions=True)
+        
+        moved = [key for chunk, result in zip(chunks, results) if not isinstance(result, Exception) for key in chunk]
+        failures = [(chunk, result) for chunk, result in zip(chunks, results) if isinstance(result, Exception)]
+        
+        if not moved:
+            raise failures[0][1]
+        
+        output = [
+            f"✅ Successfully moved {len(moved)} issue{'s' if len(moved) != 1 else ''} to sprint {sprint_id}",
+            f"📋 Issues moved: {', '.join(moved)}"
+        ]
+        if duplicates_removed:
+            output.append(f"ℹ️  Skipped {duplicates_removed} duplicate issue key{'s' if duplicates_removed != 1 else ''}")
+        for chunk, error in failures:
+            output.append(f"❌ Failed to move {', '.join(chunk)}: {str(error)}")
+        
+        return [TextContent(type="text", text="\n".join(output))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"❌ Failed to move issues to sprint: {str(e)}")]
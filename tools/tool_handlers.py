@@ -2,13 +2,96 @@
 Comprehensive Tool Handlers for Jira MCP Server
 """
 
-from typing import Any, Dict, List, Optional, Sequence
+import asyncio
+import time
+from collections import Counter
+from functools import lru_cache, partial
+from typing import Any, Awaitable, Dict, List, Optional, Sequence, Tuple
 from mcp.types import TextContent
 from services.jira_client import JiraService
 from utils.jira_formatter import (
     format_jira_issue, format_jira_sprint, format_jira_comment, 
-    format_jira_worklog, format_issue_link, format_changelog_entry
+    format_jira_worklog, format_issue_link, format_changelog_entry, format_items
 )
+from utils.jira_validators import require_valid_issue_keys
+
+
+# Fields read by format_jira_issue; searches request only these unless told otherwise
+_ISSUE_DISPLAY_FIELDS = (
+    "summary", "status", "issuetype", "priority", "assignee", "reporter",
+    "created", "updated", "description", "project", "subtasks", "parent"
+)
+
+# Default expansions; changelog can be very large and is opt-in via the expand argument
+_DEFAULT_EXPAND = ("transitions",)
+
+# Separator placed between issues in search results
+_SEARCH_SEPARATOR = "\n\n" + "="*50 + "\n\n"
+
+# Help appended to search errors
+_JQL_HELP = (
+    "💡 **JQL Examples**:\n"
+    "- `project = PROJ AND status = \"In Progress\"`\n"
+    "- `assignee = currentUser() AND status != Done`\n"
+    "- `created >= -7d AND project = PROJ`\n"
+    "- `priority = High AND resolution is EMPTY`"
+)
+
+# Jira returns at most 100 issues per search page; larger requests are paged
+_SEARCH_PAGE_SIZE = 100
+_SEARCH_MAX_RESULTS = 500
+
+# Concurrent requests when the same update is applied to several issues
+_UPDATE_CONCURRENCY = 5
+
+# Concurrent requests per phase when transitioning several issues
+_TRANSITION_CONCURRENCY = 5
+
+# Available transitions per issue key, kept as returned by Jira alongside an index
+# by lower-cased name, and cached briefly to save a round-trip on retries.
+# Transitions depend on the issue's current status, so entries are keyed by issue
+# rather than by workflow.
+_TRANSITIONS_CACHE_TTL = 30.0
+_transitions_cache: Dict[str, Tuple[float, Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]]] = {}
+
+# Formatted issue type listings per project; issue type schemes change rarely
+_ISSUE_TYPES_CACHE_TTL = 600.0
+_issue_types_cache: Dict[str, Tuple[float, str]] = {}
+
+
+@lru_cache(maxsize=256)
+def _parse_csv(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated tool argument into stripped, non-empty parts."""
+    return tuple(part.strip() for part in value.split(",") if part.strip())
+
+
+def _index_transitions(transitions: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index transitions by lower-cased name for case-insensitive lookup; the first of duplicate names wins."""
+    index: Dict[str, Dict[str, Any]] = {}
+    for t in transitions:
+        index.setdefault(t.get("name", "").lower(), t)
+    return index
+
+
+def _includes_description(fields: Optional[Sequence[str]]) -> bool:
+    """Check whether a field selection returns the description (wildcards such as *all do)."""
+    if not fields:
+        return True
+    return "-description" not in fields and any(f == "description" or f.startswith("*") for f in fields)
+
+
+async def _get_transitions(jira_service: JiraService, issue_key: str) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Get an issue's transitions and their name index, reusing a recent lookup if present."""
+    now = time.monotonic()
+    cached = _transitions_cache.get(issue_key)
+    if cached and now - cached[0] < _TRANSITIONS_CACHE_TTL:
+        return cached[1]
+    
+    transitions_response = await jira_service.get_issue_transitions(issue_key)
+    transition_list = transitions_response.get("transitions", [])
+    transitions = (transition_list, _index_transitions(transition_list))
+    _transitions_cache[issue_key] = (now, transitions)
+    return transitions
 
 
 async def handle_get_issue(jira_service: JiraService, arguments: Dict[str, Any]) -> Sequence[TextContent]:
@@ -17,17 +100,20 @@ async def handle_get_issue(jira_service: JiraService, arguments: Dict[str, Any])
         issue_key = arguments.get("issue_key")
         if not issue_key:
             return [TextContent(type="text", text="❌ issue_key is required")]
+        invalid = require_valid_issue_keys(issue_key)
+        if invalid:
+            return invalid
         
-        fields = arguments.get("fields", "").split(",") if arguments.get("fields") else None
-        expand = arguments.get("expand", "").split(",") if arguments.get("expand") else ["transitions", "changelog", "subtasks", "description"]
+        fields = _parse_csv(arguments.get("fields") or "") or None
+        expand = _parse_csv(arguments.get("expand") or "") or _DEFAULT_EXPAND
         
         issue = await jira_service.get_issue(
             issue_key=issue_key,
-            fields=[f.strip() for f in fields] if fields else None,
-            expand=[e.strip() for e in expand] if expand else None
+            fields=fields,
+            expand=expand
         )
         
-        formatted_issue = format_jira_issue(issue)
+        formatted_issue = format_jira_issue(issue, include_description=_includes_description(fields))
         return [TextContent(type="text", text=formatted_issue)]
         
     except Exception as e:
@@ -41,16 +127,18 @@ async def handle_create_issue(jira_service: JiraService, arguments: Dict[str, An
         summary = arguments.get("summary")
         description = arguments.get("description")
         issue_type = arguments.get("issue_type", "Task")
+        priority = arguments.get("priority")
+        assignee = arguments.get("assignee")
         
         if not all([project_key, summary, description]):
             return [TextContent(type="text", text="❌ project_key, summary, and description are required")]
         
         # Build additional fields
         additional_fields = {}
-        if arguments.get("priority"):
-            additional_fields["priority"] = {"name": arguments.get("priority")}
-        if arguments.get("assignee"):
-            additional_fields["assignee"] = {"name": arguments.get("assignee")}
+        if priority:
+            additional_fields["priority"] = {"name": priority}
+        if assignee:
+            additional_fields["assignee"] = {"name": assignee}
         
         result = await jira_service.create_issue(
             project_key=project_key,
@@ -66,10 +154,10 @@ async def handle_create_issue(jira_service: JiraService, arguments: Dict[str, An
         success_msg += f"🏷️  Type: {issue_type}\n"
         success_msg += f"📁 Project: {project_key}"
         
-        if arguments.get("priority"):
-            success_msg += f"\n⚡ Priority: {arguments.get('priority')}"
-        if arguments.get("assignee"):
-            success_msg += f"\n👤 Assignee: {arguments.get('assignee')}"
+        if priority:
+            success_msg += f"\n⚡ Priority: {priority}"
+        if assignee:
+            success_msg += f"\n👤 Assignee: {assignee}"
         
         return [TextContent(type="text", text=success_msg)]
         
@@ -87,9 +175,12 @@ async def handle_create_child_issue(jira_service: JiraService, arguments: Dict[s
         
         if not all([parent_issue_key, summary, description]):
             return [TextContent(type="text", text="❌ parent_issue_key, summary, and description are required")]
+        invalid = require_valid_issue_keys(parent_issue_key)
+        if invalid:
+            return invalid
         
         # Get parent issue to determine project
-        parent_issue = await jira_service.get_issue(parent_issue_key)
+        parent_issue = await jira_service.get_issue(parent_issue_key, fields=["project"])
         project_key = parent_issue["fields"]["project"]["key"]
         
         result = await jira_service.create_issue(
@@ -112,35 +203,77 @@ async def handle_create_child_issue(jira_service: JiraService, arguments: Dict[s
         return [TextContent(type="text", text=f"❌ Failed to create child issue: {str(e)}")]
 
 
+async def _update_issues(jira_service: JiraService, issue_keys: List[str], update_fields: Dict[str, Any],
+                         updated_items: List[Tuple[str, Any]]) -> str:
+    """Apply one field update to several issues concurrently and summarize the outcome."""
+    semaphore = asyncio.Semaphore(_UPDATE_CONCURRENCY)
+    
+    async def update_one(key: str) -> None:
+        async with semaphore:
+            await jira_service.update_issue(issue_key=key, fields=update_fields)
+    
+    results = await asyncio.gather(*(update_one(key) for key in issue_keys), return_exceptions=True)
+    
+    updated = [key for key, result in zip(issue_keys, results) if not isinstance(result, Exception)]
+    failures = [(key, result) for key, result in zip(issue_keys, results) if isinstance(result, Exception)]
+    
+    if not updated:
+        raise failures[0][1]
+    
+    output = [f"✅ Successfully updated {len(updated)} issue{'s' if len(updated) != 1 else ''}: {', '.join(updated)}"]
+    output.extend(f"📝 Updated {field}: {value}" for field, value in updated_items)
+    for key, error in failures:
+        output.append(f"❌ Failed to update {key}: {str(error)}")
+    
+    return "\n".join(output)
+
+
 async def handle_update_issue(jira_service: JiraService, arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """Handle update_issue tool call."""
     try:
         issue_key = arguments.get("issue_key")
-        if not issue_key:
-            return [TextContent(type="text", text="❌ issue_key is required")]
+        issue_keys = arguments.get("issue_keys") or []
+        if not issue_key and not issue_keys:
+            return [TextContent(type="text", text="❌ issue_key or issue_keys is required")]
+        
+        # Every key to update, deduplicated in order with issue_key first
+        requested_keys = list(dict.fromkeys([issue_key, *issue_keys] if issue_key else issue_keys))
+        invalid = require_valid_issue_keys(*requested_keys)
+        if invalid:
+            return invalid
+        
+        summary = arguments.get("summary")
+        description = arguments.get("description")
+        priority = arguments.get("priority")
+        assignee = arguments.get("assignee")
         
         # Build update fields
         update_fields = {}
-        if arguments.get("summary"):
-            update_fields["summary"] = arguments.get("summary")
-        if arguments.get("description"):
-            update_fields["description"] = arguments.get("description")
-        if arguments.get("priority"):
-            update_fields["priority"] = {"name": arguments.get("priority")}
-        if arguments.get("assignee"):
-            update_fields["assignee"] = {"name": arguments.get("assignee")}
+        if summary:
+            update_fields["summary"] = summary
+        if description:
+            update_fields["description"] = description
+        if priority:
+            update_fields["priority"] = {"name": priority}
+        if assignee:
+            update_fields["assignee"] = {"name": assignee}
         
         if not update_fields:
             return [TextContent(type="text", text="❌ At least one field to update must be provided")]
         
+        # Arguments echoed back in the result
+        updated_items = [(field, value) for field, value in arguments.items() if field not in ("issue_key", "issue_keys") and value]
+        
+        # Apply the same update to several issues concurrently
+        if issue_keys:
+            return [TextContent(type="text", text=await _update_issues(jira_service, requested_keys, update_fields, updated_items))]
+        
         await jira_service.update_issue(issue_key=issue_key, fields=update_fields)
         
-        success_msg = f"✅ Successfully updated issue {issue_key}\n"
-        for field, value in arguments.items():
-            if field != "issue_key" and value:
-                success_msg += f"📝 Updated {field}: {value}\n"
+        success_parts = [f"✅ Successfully updated issue {issue_key}"]
+        success_parts.extend(f"📝 Updated {field}: {value}" for field, value in updated_items)
         
-        return [TextContent(type="text", text=success_msg.rstrip())]
+        return [TextContent(type="text", text="\n".join(success_parts))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"❌ Failed to update issue: {str(e)}")]
@@ -153,20 +286,31 @@ async def handle_search_issues(jira_service: JiraService, arguments: Dict[str, A
         if not jql:
             return [TextContent(type="text", text="❌ jql is required")]
         
-        fields = arguments.get("fields", "").split(",") if arguments.get("fields") else None
-        expand = arguments.get("expand", "").split(",") if arguments.get("expand") else ["transitions", "changelog", "subtasks", "description"]
-        max_results = min(arguments.get("max_results", 30), 100)
+        fields = _parse_csv(arguments.get("fields") or "") or _ISSUE_DISPLAY_FIELDS
+        expand = _parse_csv(arguments.get("expand") or "") or _DEFAULT_EXPAND
+        max_results = min(arguments.get("max_results", 30), _SEARCH_MAX_RESULTS)
         
         search_result = await jira_service.search_issues(
             jql=jql,
-            fields=[f.strip() for f in fields] if fields else None,
-            expand=[e.strip() for e in expand] if expand else None,
-            max_results=max_results
+            fields=fields,
+            expand=expand,
+            max_results=min(max_results, _SEARCH_PAGE_SIZE)
         )
         
         issues = search_result.get("issues", [])
         total = search_result.get("total", 0)
         
+        # Follow the page token until enough issues have been collected
+        while len(issues) < max_results and search_result.get("nextPageToken"):
+            search_result = await jira_service.search_issues(
+                jql=jql,
+                fields=fields,
+                expand=expand,
+                max_results=min(max_results - len(issues), _SEARCH_PAGE_SIZE),
+                next_page_token=search_result["nextPageToken"]
+            )
+            issues.extend(search_result.get("issues", []))
+        
         if not issues:
             return [TextContent(type="text", text="No issues found matching the search criteria.")]
         
@@ -178,12 +322,9 @@ async def handle_search_issues(jira_service: JiraService, arguments: Dict[str, A
             output.append(f"🔍 **Search Results**: Found {len(issues)} issue{'s' if len(issues) != 1 else ''}\n")
         
         # Format each issue
-        for i, issue in enumerate(issues):
-            formatted_issue = format_jira_issue(issue)
-            output.append(formatted_issue)
-            
-            if i < len(issues) - 1:
-                output.append("\n" + "="*50 + "\n")
+        formatter = partial(format_jira_issue, include_description=_includes_description(fields))
+        formatted_issues = await format_items(formatter, issues)
+        output.append(_SEARCH_SEPARATOR.join(formatted_issues))
         
         # Add footer if there are more results
         if total > len(issues):
@@ -193,13 +334,7 @@ async def handle_search_issues(jira_service: JiraService, arguments: Dict[str, A
         return [TextContent(type="text", text="\n".join(output))]
         
     except Exception as e:
-        error_msg = f"❌ Failed to search issues: {str(e)}\n\n"
-        error_msg += "💡 **JQL Examples**:\n"
-        error_msg += "- `project = PROJ AND status = \"In Progress\"`\n"
-        error_msg += "- `assignee = currentUser() AND status != Done`\n"
-        error_msg += "- `created >= -7d AND project = PROJ`\n"
-        error_msg += "- `priority = High AND resolution is EMPTY`"
-        return [TextContent(type="text", text=error_msg)]
+        return [TextContent(type="text", text=f"❌ Failed to search issues: {str(e)}\n\n{_JQL_HELP}")]
 
 
 async def handle_list_issue_types(jira_service: JiraService, arguments: Dict[str, Any]) -> Sequence[TextContent]:
@@ -209,6 +344,11 @@ async def handle_list_issue_types(jira_service: JiraService, arguments: Dict[str
         if not project_key:
             return [TextContent(type="text", text="❌ project_key is required")]
         
+        now = time.monotonic()
+        cached = _issue_types_cache.get(project_key)
+        if cached and now - cached[0] < _ISSUE_TYPES_CACHE_TTL:
+            return [TextContent(type="text", text=cached[1])]
+        
         issue_types = await jira_service.get_project_issue_types(project_key)
         
         if not issue_types:
@@ -227,7 +367,9 @@ async def handle_list_issue_types(jira_service: JiraService, arguments: Dict[str
                 output.append(f"   {description}")
             output.append("")
         
-        return [TextContent(type="text", text="\n".join(output))]
+        formatted_types = "\n".join(output)
+        _issue_types_cache[project_key] = (now, formatted_types)
+        return [TextContent(type="text", text=formatted_types)]
         
     except Exception as e:
         return [TextContent(type="text", text=f"❌ Failed to get issue types: {str(e)}")]
@@ -241,43 +383,120 @@ async def handle_transition_issue(jira_service: JiraService, arguments: Dict[str
         
         if not all([issue_key, transition_name]):
             return [TextContent(type="text", text="❌ issue_key and transition_name are required")]
+        invalid = require_valid_issue_keys(issue_key)
+        if invalid:
+            return invalid
         
         # Get available transitions
-        transitions_response = await jira_service.get_issue_transitions(issue_key)
-        transitions = transitions_response.get("transitions", [])
+        transition_list, transitions = await _get_transitions(jira_service, issue_key)
         
         if not transitions:
             return [TextContent(type="text", text=f"❌ No transitions available for issue {issue_key}")]
         
         # Find matching transition
-        target_transition = None
-        available_transitions = []
-        
-        for transition in transitions:
-            trans_name = transition.get("name", "")
-            available_transitions.append(trans_name)
-            
-            if trans_name.lower() == transition_name.lower():
-                target_transition = transition
-                break
+        target_transition = transitions.get(transition_name.lower())
         
         if not target_transition:
-            error_msg = f"❌ Transition '{transition_name}' not found for issue {issue_key}\n\n"
-            error_msg += "Available transitions:\n"
-            for i, trans_name in enumerate(available_transitions, 1):
-                error_msg += f"  {i}. {trans_name}\n"
-            return [TextContent(type="text", text=error_msg)]
+            available_transitions = [t.get("name", "") for t in transition_list]
+            error_parts = [
+                f"❌ Transition '{transition_name}' not found for issue {issue_key}\n",
+                "Available transitions:"
+            ]
+            error_parts.extend(f"  {i}. {trans_name}" for i, trans_name in enumerate(available_transitions, 1))
+            return [TextContent(type="text", text="\n".join(error_parts))]
         
         # Perform transition
         transition_id = target_transition.get("id")
-        await jira_service.transition_issue(issue_key=issue_key, transition_id=transition_id)
+        try:
+            await jira_service.transition_issue(issue_key=issue_key, transition_id=transition_id)
+        finally:
+            # Available transitions depend on the new status, and a failure may mean the entry was stale
+            _transitions_cache.pop(issue_key, None)
         
-        to_status = target_transition.get("to", {}).get("name", "Unknown")
-        success_msg = f"✅ Successfully transitioned issue {issue_key}\n"
-        success_msg += f"🔄 Transition: {transition_name}\n"
-        success_msg += f"📊 New Status: {to_status}"
+        to_status = (target_transition.get("to") or {}).get("name", "Unknown")
+        success_parts = [
+            f"✅ Successfully transitioned issue {issue_key}",
+            f"🔄 Transition: {transition_name}",
+            f"📊 New Status: {to_status}"
+        ]
         
-        return [TextContent(type="text", text=success_msg)]
+        return [TextContent(type="text", text="\n".join(success_parts))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"❌ Failed to transition issue: {str(e)}")]
+
+
+async def handle_batch_transition_issues(jira_service: JiraService, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    """Handle batch_transition_issues tool call."""
+    try:
+        items = arguments.get("items", [])
+        if not items:
+            return [TextContent(type="text", text="❌ items list is required")]
+        
+        if not all(item.get("issue_key") and item.get("transition_name") for item in items):
+            return [TextContent(type="text", text="❌ Each item requires issue_key and transition_name")]
+        
+        invalid = require_valid_issue_keys(*(item["issue_key"] for item in items))
+        if invalid:
+            return invalid
+        
+        # An issue can only move once per batch; concurrent transitions of the same issue would race
+        issue_key_counts = Counter(item["issue_key"] for item in items)
+        repeated_keys = [key for key, count in issue_key_counts.items() if count > 1]
+        if repeated_keys:
+            return [TextContent(type="text", text=f"❌ Each issue may appear only once per batch; repeated: {', '.join(repeated_keys)}")]
+        
+        semaphore = asyncio.Semaphore(_TRANSITION_CONCURRENCY)
+        
+        async def bounded(coro: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await coro
+        
+        # Look up transitions for all issues concurrently
+        transitions_results = await asyncio.gather(
+            *(bounded(_get_transitions(jira_service, item["issue_key"])) for item in items),
+            return_exceptions=True
+        )
+        
+        results = [""] * len(items)
+        pending = []
+        for i, (item, transitions) in enumerate(zip(items, transitions_results)):
+            issue_key = item["issue_key"]
+            transition_name = item["transition_name"]
+            
+            if isinstance(transitions, Exception):
+                results[i] = f"❌ {issue_key}: {str(transitions)}"
+                continue
+            
+            target_transition = transitions[1].get(transition_name.lower())
+            if not target_transition:
+                results[i] = f"❌ {issue_key}: Transition '{transition_name}' not found"
+                continue
+            
+            pending.append((i, issue_key, target_transition))
+        
+        # Perform the resolved transitions concurrently
+        outcomes = await asyncio.gather(
+            *(bounded(jira_service.transition_issue(issue_key=issue_key, transition_id=target_transition.get("id")))
+              for _, issue_key, target_transition in pending),
+            return_exceptions=True
+        )
+        
+        succeeded = 0
+        for (i, issue_key, target_transition), outcome in zip(pending, outcomes):
+            _transitions_cache.pop(issue_key, None)
+            if isinstance(outcome, Exception):
+                results[i] = f"❌ {issue_key}: {str(outcome)}"
+                continue
+            
+            succeeded += 1
+            to_status = (target_transition.get("to") or {}).get("name", "Unknown")
+            results[i] = f"✅ {issue_key}: {target_transition.get('name', '')} → {to_status}"
+        
+        output = [f"🔄 **Batch Transition**: {succeeded} of {len(items)} issue{'s' if len(items) != 1 else ''} transitioned\n"]
+        output.extend(results)
+        
+        return [TextContent(type="text", text="\n".join(output))]
+        
+    except Exception as e:
+        return [TextContent(type="text", text=f"❌ Failed to transition issues: {str(e)}")]
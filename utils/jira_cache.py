@@ -0,0 +1,49 @@
+"""
+Jira Cache Utility
+Provides a bounded time-limited cache for slowly changing Jira responses
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class ResponseCache:
+    """Single-flight TTL cache of request futures, bounded to maxsize entries."""
+    
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        # Cached requests by key: (expiry on the monotonic clock, request future)
+        self._entries: Dict[str, Tuple[float, asyncio.Future]] = {}
+    
+    async def cached_call(self, key: str, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached result for key, or fetch it once and share it with concurrent callers."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry and entry[0] > now:
+            return await asyncio.shield(entry[1])
+        
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            self._evict(now)
+        
+        task = asyncio.ensure_future(fetch())
+        self._entries[key] = (now + ttl, task)
+        task.add_done_callback(lambda t: self._drop_failed(key, t))
+        return await asyncio.shield(task)
+    
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then the oldest ones if the cache is still full."""
+        for key in [key for key, (expiry, _) in self._entries.items() if expiry <= now]:
+            del self._entries[key]
+        
+        # Entries are kept in insertion order, so the first ones are the oldest
+        while len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+    
+    def _drop_failed(self, key: str, task: asyncio.Future) -> None:
+        """Evict a cache entry whose request failed so the next call retries."""
+        if task.cancelled() or task.exception() is not None:
+            entry = self._entries.get(key)
+            if entry and entry[1] is task:
+                del self._entries[key]
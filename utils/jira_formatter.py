@@ -3,27 +3,51 @@ Jira Formatter Utility
 Provides consistent formatting for Jira data structures
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 
 
-def format_jira_issue(issue: Dict[str, Any]) -> str:
-    """Format a Jira issue for display."""
-    fields = issue.get("fields", {})
+# Shared pool for formatting large result sets off the event loop
+_FORMAT_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="jira-format")
+
+# Below this many items a thread hand-off costs more than formatting inline
+_OFFLOAD_THRESHOLD = 50
+
+# Timestamps as Jira returns them, e.g. 2024-01-02T03:04:05.000+0000
+_JIRA_DATETIME_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2}:\d{2})(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?$")
+
+# Display format for timestamps parsed from other ISO 8601 forms
+_DATETIME_DISPLAY_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
+
+async def format_items(formatter: Callable[[Dict[str, Any]], str], items: List[Dict[str, Any]]) -> List[str]:
+    """Format a list of Jira objects, moving large batches off the event loop."""
+    if len(items) < _OFFLOAD_THRESHOLD:
+        return [formatter(item) for item in items]
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_FORMAT_EXECUTOR, lambda: [formatter(item) for item in items])
+
+
+def format_jira_issue(issue: Dict[str, Any], *, include_description: bool = True,
+                      include_transitions: bool = True) -> str:
+    """Format a Jira issue for display, optionally leaving out the description and transitions."""
+    fields = issue.get("fields") or {}
     
     # Basic information
     key = issue.get("key", "Unknown")
     summary = fields.get("summary", "No summary")
-    status = fields.get("status", {}).get("name", "Unknown")
-    issue_type = fields.get("issuetype", {}).get("name", "Unknown")
-    priority = fields.get("priority", {}).get("name", "None")
+    status = (fields.get("status") or {}).get("name", "Unknown")
+    issue_type = (fields.get("issuetype") or {}).get("name", "Unknown")
+    priority = (fields.get("priority") or {}).get("name", "None")
     
     # Assignee and reporter
-    assignee = fields.get("assignee")
-    assignee_name = assignee.get("displayName", "Unassigned") if assignee else "Unassigned"
-    
-    reporter = fields.get("reporter")
-    reporter_name = reporter.get("displayName", "Unknown") if reporter else "Unknown"
+    assignee_name = (fields.get("assignee") or {}).get("displayName", "Unassigned")
+    reporter_name = (fields.get("reporter") or {}).get("displayName", "Unknown")
     
     # Dates
     created = fields.get("created", "")
@@ -34,57 +58,57 @@ def format_jira_issue(issue: Dict[str, Any]) -> str:
     if updated:
         updated = format_datetime(updated)
     
-    # Description
-    description = extract_text_from_adf(fields.get("description"))
-    if not description:
-        description = "No description"
+    # Description; skipping it also skips walking the ADF document
+    description_line = None
+    if include_description:
+        description = extract_text_from_adf(fields.get("description")) or "No description"
+        description_line = f"📄 **Description**: {description}"
     
     # Project
-    project = fields.get("project", {})
+    project = fields.get("project") or {}
     project_name = project.get("name", "Unknown")
     project_key = project.get("key", "Unknown")
     
-    # Build the formatted output
-    output = []
-    output.append(f"🎫 **{key}**: {summary}")
-    output.append(f"📊 **Status**: {status}")
-    output.append(f"🏷️  **Type**: {issue_type}")
-    output.append(f"⚡ **Priority**: {priority}")
-    output.append(f"👤 **Assignee**: {assignee_name}")
-    output.append(f"📝 **Reporter**: {reporter_name}")
-    output.append(f"📁 **Project**: {project_name} ({project_key})")
-    
-    if created:
-        output.append(f"📅 **Created**: {created}")
-    if updated:
-        output.append(f"🔄 **Updated**: {updated}")
+    # Optional sections; omitted entirely when the issue has no such data
+    subtasks = fields.get("subtasks")
+    subtasks_block = "\n".join(
+        ["📋 **Subtasks**:"] + [_format_subtask_line(subtask) for subtask in subtasks]
+    ) if subtasks else None
     
-    output.append(f"📄 **Description**: {description}")
-    
-    # Add subtasks if present
-    subtasks = fields.get("subtasks", [])
-    if subtasks:
-        output.append("📋 **Subtasks**:")
-        for subtask in subtasks:
-            subtask_key = subtask.get("key", "Unknown")
-            subtask_summary = subtask.get("fields", {}).get("summary", "No summary")
-            subtask_status = subtask.get("fields", {}).get("status", {}).get("name", "Unknown")
-            output.append(f"  - {subtask_key}: {subtask_summary} ({subtask_status})")
-    
-    # Add parent if present
     parent = fields.get("parent")
-    if parent:
-        parent_key = parent.get("key", "Unknown")
-        parent_summary = parent.get("fields", {}).get("summary", "No summary")
-        output.append(f"⬆️  **Parent**: {parent_key}: {parent_summary}")
-    
-    # Add available transitions if present
-    transitions = issue.get("transitions", [])
-    if transitions:
-        transition_names = [t.get("name", "Unknown") for t in transitions]
-        output.append(f"🔄 **Available Transitions**: {', '.join(transition_names)}")
-    
-    return "\n".join(output)
+    parent_line = (
+        f"⬆️  **Parent**: {parent.get('key', 'Unknown')}: {(parent.get('fields') or {}).get('summary', 'No summary')}"
+    ) if parent else None
+    
+    transitions = issue.get("transitions") if include_transitions else None
+    transitions_line = (
+        f"🔄 **Available Transitions**: {', '.join(t.get('name', 'Unknown') for t in transitions)}"
+    ) if transitions else None
+    
+    # Build the formatted output in a single join
+    return "\n".join(filter(None, (
+        f"🎫 **{key}**: {summary}",
+        f"📊 **Status**: {status}",
+        f"🏷️  **Type**: {issue_type}",
+        f"⚡ **Priority**: {priority}",
+        f"👤 **Assignee**: {assignee_name}",
+        f"📝 **Reporter**: {reporter_name}",
+        f"📁 **Project**: {project_name} ({project_key})",
+        created and f"📅 **Created**: {created}",
+        updated and f"🔄 **Updated**: {updated}",
+        description_line,
+        subtasks_block,
+        parent_line,
+        transitions_line,
+    )))
+
+
+def _format_subtask_line(subtask: Dict[str, Any]) -> str:
+    """Format a subtask as a bullet line under its parent issue."""
+    subtask_fields = subtask.get("fields") or {}
+    subtask_summary = subtask_fields.get("summary", "No summary")
+    subtask_status = (subtask_fields.get("status") or {}).get("name", "Unknown")
+    return f"  - {subtask.get('key', 'Unknown')}: {subtask_summary} ({subtask_status})"
 
 
 def format_jira_sprint(sprint: Dict[str, Any]) -> str:
@@ -169,20 +193,19 @@ def format_issue_link(link: Dict[str, Any]) -> str:
     link_type = link.get("type", {})
     type_name = link_type.get("name", "Unknown")
     
-    inward_issue = link.get("inwardIssue")
-    outward_issue = link.get("outwardIssue")
-    
-    if inward_issue:
-        key = inward_issue.get("key", "Unknown")
-        summary = inward_issue.get("fields", {}).get("summary", "No summary")
-        status = inward_issue.get("fields", {}).get("status", {}).get("name", "Unknown")
-        direction = link_type.get("inward", "relates to")
-        return f"🔗 {direction} {key}: {summary} ({status})"
-    elif outward_issue:
-        key = outward_issue.get("key", "Unknown")
-        summary = outward_issue.get("fields", {}).get("summary", "No summary")
-        status = outward_issue.get("fields", {}).get("status", {}).get("name", "Unknown")
-        direction = link_type.get("outward", "relates to")
+    # A link carries the other issue on exactly one side
+    linked_issue = link.get("inwardIssue")
+    direction_key = "inward"
+    if not linked_issue:
+        linked_issue = link.get("outwardIssue")
+        direction_key = "outward"
+    
+    if linked_issue:
+        fields = linked_issue.get("fields") or {}
+        key = linked_issue.get("key", "Unknown")
+        summary = fields.get("summary", "No summary")
+        status = (fields.get("status") or {}).get("name", "Unknown")
+        direction = link_type.get(direction_key, "relates to")
         return f"🔗 {direction} {key}: {summary} ({status})"
     
     return f"🔗 {type_name} (Unknown issue)"
@@ -224,33 +247,39 @@ def extract_text_from_adf(adf_content: Optional[Dict[str, Any]]) -> str:
     if not adf_content:
         return ""
     
-    def extract_text_recursive(node: Dict[str, Any]) -> str:
+    # Walk the tree depth-first with an explicit stack; children are pushed in
+    # reverse so text is collected in document order
+    text_parts = []
+    stack = [adf_content]
+    while stack:
+        node = stack.pop()
         if not isinstance(node, dict):
-            return ""
+            continue
         
-        text_parts = []
-        
-        # If this is a text node, return its text
         if node.get("type") == "text":
-            return node.get("text", "")
+            text_parts.append(node.get("text", ""))
+            continue
         
-        # If this node has content, process it recursively
-        content = node.get("content", [])
+        content = node.get("content")
         if isinstance(content, list):
-            for child in content:
-                text_parts.append(extract_text_recursive(child))
-        
-        return "".join(text_parts)
+            stack.extend(reversed(content))
     
-    return extract_text_recursive(adf_content).strip()
+    return "".join(text_parts).strip()
 
 
+@lru_cache(maxsize=2048)
 def format_datetime(datetime_str: str) -> str:
     """Format a datetime string for display."""
+    # Jira's own timestamp format can be rearranged without parsing
+    match = _JIRA_DATETIME_RE.match(datetime_str) if isinstance(datetime_str, str) else None
+    if match:
+        return f"{match[1]} {match[2]} UTC"
+    
     try:
-        # Parse ISO format datetime
-        dt = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-        return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+        # Parse ISO format datetime; only a trailing Z needs rewriting for fromisoformat
+        iso_str = datetime_str[:-1] + '+00:00' if datetime_str.endswith('Z') else datetime_str
+        dt = datetime.fromisoformat(iso_str)
+        return dt.strftime(_DATETIME_DISPLAY_FORMAT)
     except (ValueError, AttributeError):
         return datetime_str
 
@@ -274,7 +303,7 @@ def format_time_duration(seconds: int) -> str:
 
 
 def truncate_text(text: str, max_length: int = 100) -> str:
-    """Truncate text to a maximum length."""
+    """Truncate text to a maximum length, marking the cut with an ellipsis."""
     if len(text) <= max_length:
         return text
-    return text[:max_length - 3] + "..."
+    return text[:max_length - 1] + "…"
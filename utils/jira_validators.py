@@ -0,0 +1,50 @@
+"""
+Jira Validation Utility
+Provides local format checks for Jira identifiers before they are sent to the API
+"""
+
+import re
+from typing import Any, Iterable, List, Optional
+from mcp.types import TextContent
+
+
+# Issue keys such as PROJ-123 (Jira matches keys case-insensitively) or numeric issue ids
+_ISSUE_KEY_RE = re.compile(r"[A-Za-z][A-Za-z0-9_]*-\d+|\d+", re.ASCII)
+
+# Sprint ids are positive integers
+_SPRINT_ID_RE = re.compile(r"\d+", re.ASCII)
+
+
+def is_valid_issue_key(issue_key: Any) -> bool:
+    """Check whether a value looks like a Jira issue key or issue id."""
+    return isinstance(issue_key, str) and _ISSUE_KEY_RE.fullmatch(issue_key) is not None
+
+
+def invalid_issue_keys(issue_keys: Iterable[Any]) -> List[Any]:
+    """Return the values that do not look like Jira issue keys or issue ids."""
+    return [key for key in issue_keys if not is_valid_issue_key(key)]
+
+
+def is_valid_sprint_id(sprint_id: Any) -> bool:
+    """Check whether a value looks like a Jira sprint id."""
+    return not isinstance(sprint_id, bool) and _SPRINT_ID_RE.fullmatch(str(sprint_id)) is not None
+
+
+def require_valid_issue_keys(*issue_keys: Any) -> Optional[List[TextContent]]:
+    """Return a tool error naming any malformed issue keys, or None when all are valid."""
+    invalid_keys = invalid_issue_keys(issue_keys)
+    if not invalid_keys:
+        return None
+    
+    if len(issue_keys) == 1:
+        message = f"❌ Invalid issue key: {invalid_keys[0]} (expected format PROJ-123)"
+    else:
+        message = f"❌ Invalid issue keys: {', '.join(map(str, invalid_keys))} (expected format PROJ-123)"
+    return [TextContent(type="text", text=message)]
+
+
+def require_valid_sprint_id(sprint_id: Any) -> Optional[List[TextContent]]:
+    """Return a tool error for a malformed sprint id, or None when it is valid."""
+    if is_valid_sprint_id(sprint_id):
+        return None
+    return [TextContent(type="text", text=f"❌ Invalid sprint_id: {sprint_id} (expected a numeric sprint id)")]